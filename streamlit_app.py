@@ -3,23 +3,14 @@ Streamlit 통계 학습 앱 - "어떤 대푯값이 좋을까?" 페이지
 OpenAI 없이 작동하는 안전한 버전 (에러 해결됨!)
 
 필요한 패키지 설치:
-pip install streamlit pandas numpy
+pip install streamlit
 
 이것만 설치하면 바로 작동합니다! 🚀
 """
 
+import re
 import streamlit as st
-import pandas as pd
-import numpy as np
-import time
-from collections import Counter
-
-# 페이지 설정
-st.set_page_config(
-    page_title="🤔 어떤 대푯값이 좋을까?",
-    page_icon="📊",
-    layout="wide"
-)
+from statistics import fmean, median, mode
 
 # 페이지 설정
 st.set_page_config(
@@ -109,29 +100,28 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # 세션 상태 초기화
-if 'answers_submitted' not in st.session_state:
-    st.session_state.answers_submitted = {}
-if 'ai_examples_checked' not in st.session_state:
-    st.session_state.ai_examples_checked = {}
-if 'answers_submitted' not in st.session_state:
-    st.session_state.answers_submitted = {}
-if 'ai_examples_checked' not in st.session_state:
-    st.session_state.ai_examples_checked = {}
+for state_key in ('answers_submitted', 'ai_examples_checked'):
+    st.session_state.setdefault(state_key, {})
+
+# 키워드 목록을 정규식 대안(|) 문자열로 변환
+def keyword_alternation(keywords):
+    return '|'.join(map(re.escape, keywords))
+
+# 키워드 목록을 하나의 정규식으로 컴파일 (한 번의 탐색으로 매칭)
+def compile_keywords(keywords):
+    return re.compile(keyword_alternation(keywords))
 
 # 통계 계산 함수
 def calculate_stats(data):
-    mean = np.mean(data)
-    median = np.median(data)
-    mode_counter = Counter(data)
-    mode = mode_counter.most_common(1)[0][0]
+    # 자료가 8개 이하라 numpy보다 표준 라이브러리가 더 빠름
     return {
-        'mean': round(mean, 1),
-        'median': median,
-        'mode': mode
+        'mean': round(fmean(data), 1),
+        'median': float(median(data)),
+        'mode': mode(data)
     }
 
 # 시나리오 데이터
-scenarios = {
+SCENARIOS = {
     1: {
         'title': '예제 1: 제기차기 횟수',
         'data': [4, 5, 6, 6, 6, 7, 7, 23],
@@ -146,33 +136,51 @@ scenarios = {
     }
 }
 
+# 데이터 항목 강조 클래스 (이상치 / 최빈값)
+def data_item_class(scenario_id, scenario, idx):
+    if scenario_id == 1 and idx == scenario.get('outlier_index'):
+        return ' outlier'
+    if scenario_id == 2 and idx in scenario.get('mode_indices', []):
+        return ' mode-highlight'
+    return ''
+
+# 대푯값과 데이터 HTML은 렌더링 루프 밖에서 한 번만 계산
+for scenario_id, scenario in SCENARIOS.items():
+    scenario['stats'] = calculate_stats(scenario['data'])
+    scenario['data_html'] = ''.join(
+        f'<span class="data-item{data_item_class(scenario_id, scenario, idx)}">{value}</span> '
+        for idx, value in enumerate(scenario['data'])
+    )
+
+# 시나리오별 정답 체크 기준 (키워드 기반)
+CORRECT_ANSWERS = {
+    1: {"stats": ["중앙값", "최빈값"], "keywords": ["극단값", "이상치", "왜곡", "영향", "극단"]},
+    2: {"stats": ["최빈값"], "keywords": ["많이 팔린", "빈도", "자주", "흔한"]}
+}
+
+CORRECT_PATTERNS = {
+    scenario_id: compile_keywords(answer["keywords"])
+    for scenario_id, answer in CORRECT_ANSWERS.items()
+}
+
 st.header("📊 예제 분석 — 어떤 대푯값이 적절할까?")
 
 # 두 시나리오를 나란히 표시
 col1, col2 = st.columns(2)
 
-for i, (scenario_id, scenario) in enumerate(scenarios.items()):
+for i, (scenario_id, scenario) in enumerate(SCENARIOS.items()):
     with col1 if i == 0 else col2:
+        # 제목과 데이터를 한 번에 표시
         st.markdown(f"""
         <div class="scenario-box">
             <h3>{scenario['title']}</h3>
         </div>
+
+        **데이터:** {scenario['data_html']}
         """, unsafe_allow_html=True)
         
-        # 데이터 표시
-        data_html = ""
-        for idx, value in enumerate(scenario['data']):
-            if scenario_id == 1 and idx == scenario.get('outlier_index'):
-                data_html += f'<span class="data-item outlier">{value}</span> '
-            elif scenario_id == 2 and idx in scenario.get('mode_indices', []):
-                data_html += f'<span class="data-item mode-highlight">{value}</span> '
-            else:
-                data_html += f'<span class="data-item">{value}</span> '
-        
-        st.markdown(f"**데이터:** {data_html}", unsafe_allow_html=True)
-        
-        # 대푯값 계산 및 표시
-        stats = calculate_stats(scenario['data'])
+        # 대푯값 표시
+        stats = scenario['stats']
         
         with st.expander("📈 대푯값 보기", expanded=True):
             st.markdown(f"""
@@ -188,35 +196,31 @@ for i, (scenario_id, scenario) in enumerate(scenarios.items()):
         # 답변 입력
         st.subheader("💭 당신의 답변")
         
-        best_stat = st.selectbox(
-            "가장 적절한 대푯값:",
-            ["선택하세요", "평균", "중앙값", "최빈값"],
-            key=f"stat_select_{scenario_id}"
-        )
-        
-        reason = st.text_area(
-            "이유를 설명해주세요:",
-            placeholder="왜 이 대푯값이 가장 적절한지 설명해보세요...",
-            key=f"reason_{scenario_id}",
-            height=100
-        )
+        # 폼으로 묶어 입력이 바뀔 때마다 재실행되지 않고 제출 시 한 번만 재실행
+        with st.form(f"form_{scenario_id}"):
+            best_stat = st.selectbox(
+                "가장 적절한 대푯값:",
+                ["선택하세요", "평균", "중앙값", "최빈값"],
+                key=f"stat_select_{scenario_id}"
+            )
+            
+            reason = st.text_area(
+                "이유를 설명해주세요:",
+                placeholder="왜 이 대푯값이 가장 적절한지 설명해보세요...",
+                key=f"reason_{scenario_id}",
+                height=100
+            )
+            
+            # 답변 제출 버튼
+            submitted = st.form_submit_button("답변 제출")
         
-        # 답변 제출 버튼
-        if st.button(f"답변 제출", key=f"submit_{scenario_id}"):
+        if submitted:
             if best_stat != "선택하세요" and reason.strip():
                 with st.spinner("🤖 AI가 답변을 분석하고 있습니다..."):
-                    # 시뮬레이션 로딩
-                    time.sleep(2)
-                    
                     # 정답 체크 로직 (키워드 기반)
-                    correct_answers = {
-                        1: {"stats": ["중앙값", "최빈값"], "keywords": ["극단값", "이상치", "왜곡", "영향", "극단"]},
-                        2: {"stats": ["최빈값"], "keywords": ["많이 팔린", "빈도", "자주", "흔한"]}
-                    }
-                    
-                    correct = correct_answers[scenario_id]
+                    correct = CORRECT_ANSWERS[scenario_id]
                     is_correct_stat = best_stat in correct["stats"]
-                    has_key_reason = any(keyword in reason.lower() for keyword in correct["keywords"])
+                    has_key_reason = bool(CORRECT_PATTERNS[scenario_id].search(reason.lower()))
                     
                     if is_correct_stat and has_key_reason:
                         st.markdown("""
@@ -257,62 +261,87 @@ stat_types = {
     'mode': {'name': '최빈값', 'emoji': '🎯', 'color': '#f6ad55'}
 }
 
-for stat_key, stat_info in stat_types.items():
-    st.markdown(f"""
-    <div class="ai-section">
-        <h3>{stat_info['emoji']} {stat_info['name']}은 어떤 상황에서 쓰면 좋을까?</h3>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col_left, col_right = st.columns([2, 1])
+# 대푯값별 예시 분석 기준 (키워드 기반)
+ANALYSIS_RULES = {
+    'mean': {
+        'good_keywords': ['고르게', '균등', '일정', '비슷', '평균적', '고루', '분포'],
+        'bad_keywords': ['극단', '이상치', '튀는', '치우쳐', '빈도']
+    },
+    'median': {
+        'good_keywords': ['극단', '이상치', '튀는', '치우쳐', '왜곡', '한쪽으로'],
+        'bad_keywords': ['고르게', '균등', '평균적', '빈도']
+    },
+    'mode': {
+        'good_keywords': ['많이', '자주', '흔한', '인기', '빈도', '판매량', '최다'],
+        'bad_keywords': ['평균', '중간', '균등', '고르게']
+    }
+}
+
+# 좋은/나쁜 키워드를 이름 있는 그룹으로 묶어 한 번의 탐색으로 분류
+KEYWORD_PATTERNS = {
+    stat_key: re.compile(
+        f"(?P<good>{keyword_alternation(rule['good_keywords'])})"
+        f"|(?P<bad>{keyword_alternation(rule['bad_keywords'])})"
+    )
+    for stat_key, rule in ANALYSIS_RULES.items()
+}
+
+# 세 예시를 하나의 폼으로 묶어 한 번의 제출로 모두 확인
+example_texts = {}
+feedback_slots = {}
+
+with st.form("stat_examples_form"):
+    for stat_key, stat_info in stat_types.items():
+        st.markdown(f"""
+        <div class="ai-section">
+            <h3>{stat_info['emoji']} {stat_info['name']}은 어떤 상황에서 쓰면 좋을까?</h3>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([2, 1])
+        
+        with col_left:
+            example_texts[stat_key] = st.text_area(
+                f"{stat_info['name']}을 사용하는 것이 좋다고 생각하는 구체적인 상황이나 예시를 적어보세요:",
+                placeholder=f"예: {stat_info['name']}을 사용하면 좋은 상황을 설명해보세요...",
+                key=f"{stat_key}_example",
+                height=120
+            )
+        
+        # 피드백은 제출 후 각 예시 옆에 표시
+        feedback_slots[stat_key] = col_right.container()
     
-    with col_left:
-        example_text = st.text_area(
-            f"{stat_info['name']}을 사용하는 것이 좋다고 생각하는 구체적인 상황이나 예시를 적어보세요:",
-            placeholder=f"예: {stat_info['name']}을 사용하면 좋은 상황을 설명해보세요...",
-            key=f"{stat_key}_example",
-            height=120
-        )
+    examples_submitted = st.form_submit_button("🤖 AI가 모두 확인해보기")
+
+if examples_submitted:
+    # 비어 있는 예시는 건너뛰고, 세 예시가 모두 비었을 때만 안내
+    if not any(text.strip() for text in example_texts.values()):
+        st.error("❌ 예시를 입력해주세요!")
     
-    with col_right:
-        if st.button(f"🤖 AI가 확인해보기", key=f"check_{stat_key}"):
-            if example_text.strip():
-                with st.spinner("🤖 AI가 분석하고 있습니다..."):
-                    # 시뮬레이션 로딩
-                    time.sleep(1.5)
-                    
-                    # 키워드 기반 분석 로직
-                    analysis_rules = {
-                        'mean': {
-                            'good_keywords': ['고르게', '균등', '일정', '비슷', '평균적', '고루', '분포'],
-                            'bad_keywords': ['극단', '이상치', '튀는', '치우쳐', '빈도']
-                        },
-                        'median': {
-                            'good_keywords': ['극단', '이상치', '튀는', '치우쳐', '왜곡', '한쪽으로'],
-                            'bad_keywords': ['고르게', '균등', '평균적', '빈도']
-                        },
-                        'mode': {
-                            'good_keywords': ['많이', '자주', '흔한', '인기', '빈도', '판매량', '최다'],
-                            'bad_keywords': ['평균', '중간', '균등', '고르게']
-                        }
-                    }
-                    
-                    rule = analysis_rules[stat_key]
-                    lower_text = example_text.lower()
-                    
-                    has_good = any(keyword in lower_text for keyword in rule['good_keywords'])
-                    has_bad = any(keyword in lower_text for keyword in rule['bad_keywords'])
-                    
-                    if has_good and not has_bad:
-                        st.success(f"✅ 훌륭합니다! {stat_info['name']}이 적절한 상황을 잘 파악했습니다.")
-                    elif has_good:
-                        st.info(f"👍 좋습니다! {stat_info['name']}의 특성을 잘 이해하고 있어요.")
-                    else:
-                        st.warning(f"💡 {stat_info['name']}이 왜 적절한지 더 구체적으로 설명해보세요!")
+    for stat_key, stat_info in stat_types.items():
+        example_text = example_texts[stat_key]
+        if not example_text.strip():
+            continue
+        
+        with feedback_slots[stat_key]:
+            with st.spinner("🤖 AI가 분석하고 있습니다..."):
+                # 키워드 기반 분석 로직
+                matched = {
+                    match.lastgroup
+                    for match in KEYWORD_PATTERNS[stat_key].finditer(example_text.lower())
+                }
                 
-                st.session_state.ai_examples_checked[stat_key] = True
-            else:
-                st.error("❌ 예시를 입력해주세요!")
+                has_good = 'good' in matched
+                has_bad = 'bad' in matched
+                
+                if has_good and not has_bad:
+                    st.success(f"✅ 훌륭합니다! {stat_info['name']}이 적절한 상황을 잘 파악했습니다.")
+                elif has_good:
+                    st.info(f"👍 좋습니다! {stat_info['name']}의 특성을 잘 이해하고 있어요.")
+                else:
+                    st.warning(f"💡 {stat_info['name']}이 왜 적절한지 더 구체적으로 설명해보세요!")
+        
+        st.session_state.ai_examples_checked[stat_key] = True
 
 # 결론 섹션
 st.markdown("---")